@@ -13,31 +13,49 @@ __all__ = ['create_mefs',
 
 from .metrics import distance_L1, distance_L2
 import numpy as np 
+from numpy.random import Generator, SFC64
 import zipfile
-import vip_hci as vip
+import numbers
+import operator
+import io
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import tempfile
+import shutil
+from astropy.io import fits
 import warnings
 import os
-import shutil
-from time import ctime
 warnings.filterwarnings('ignore')
 
+# extensions of the MEF files read from a submission
+_MEF_EXTENSIONS = ('.fits', '.h5', '.hdf5')
+# names of the datasets of MEF files saved in HDF5 format
+_HDF5_KEYS = ('estimates', 'errors', 'posteriors')
+
 
 def create_mefs(n_mef, n_estimates, n_inj=1, estimate_bounds=[0,1], 
                 error_bounds=[0,2], nsamp_posterior=1000, save_to='./', 
-                zipname='mef1.zip', mefnames='mef'):
+                zipname='mef1.zip', mefnames='mef', keep_fits=False, 
+                fmt='fits', seed=None, compression=zipfile.ZIP_STORED):
     '''
     Function that creates MEF files with mock data for the second Exoplanet Imaging Data Challenge. 
     
     Each MEF file has three extensions: the estimates, the uncertanties and the posterior distributions 
     of the estimates. Both the estimates and the uncertanties are randomly sampled from an Uniform 
     distribution. Instead, the posterior distributions are randomly sampled from a Gaussian distribution.
+    All arrays are generated in single precision (float32).
     
     Parameters
     ----------
     ·  n_mef: int
         Number of MEF files.
-    ·  n_estimates: int
-        Number of estimates.
+    ·  n_estimates: int or list
+        Number of estimates per injection, either common to all MEF files or 
+        one per MEF file.
+    ·  n_inj: int or list
+        (optional) Number of injections, either common to all MEF files or one 
+        per MEF file. By default, n_inj=1.
     ·  estimate_bounds: list
         Inner and outer boundaries used for defining the Uniform distribution from where 
         the estimates are then randomly sampled.
@@ -48,96 +66,149 @@ def create_mefs(n_mef, n_estimates, n_inj=1, estimate_bounds=[0,1],
         Number of posterior observations randomly sampled from the Gaussian distribution.
         By default, nsamp_posterior=1000.
     ·  save_to: str
-        (optional) Path to save the MEF files created.
+        (optional) Path to save the MEF files created. If a ZIP file is 
+        created, the MEF files are only saved if keep_fits is True.
     ·  zipname: str
-        (optional)  Name of the ZIP file.
-    ·  mefnames: str
+        (optional)  Name of the ZIP file. The MEF files are written directly 
+        into it, without going through the disk.
+    ·  mefnames: str or list
          Common name for all MEF files created. Then, an numerical id is added to 
-         differentiate among them.
+         differentiate among them (e.g. 'mef1', 'mef2', ...). A list of names 
+         can also be provided, one per MEF file.
+    ·  keep_fits: bool
+        (optional) Whether to also save the MEF files in save_to when a ZIP 
+        file is created. By default, keep_fits=False.
+    ·  fmt: str
+        (optional) {'fits', 'hdf5'} Format of the MEF files. With 'hdf5' 
+        (requires h5py), each file has three datasets named 'estimates', 
+        'errors' and 'posteriors', and a '.h5' extension. By default, 
+        fmt='fits'.
+    ·  seed: int
+        (optional) Seed of the random number generator, for reproducible 
+        mock data.
+    ·  compression: int
+        (optional) Compression method of the ZIP file, e.g. zipfile.ZIP_DEFLATED.
+        By default, zipfile.ZIP_STORED (no compression), since the mock data 
+        (random floats) do not compress.
+        
+    Returns
+    -------
+    ·  d_list: list
+        List with one tuple (estimates, uncertanties, posteriors) per MEF file.
+        The arrays have shapes (n_inj, n_estimates), (n_inj, n_estimates) and 
+        (n_inj, n_estimates, nsamp_posterior), respectively.
     '''
     
-    if not isinstance(n_mef, int):
-        msg = 'n_mef must be an integer.'
-        raise ValueError(msg)
-    if not isinstance(n_estimates, int) and not isinstance(n_estimates, list):
-        msg = 'n_estimates must be an integer or a list of integers.'
-        raise ValueError(msg)
-    if not isinstance(estimate_bounds, list):
-        msg = 'estimate_bounds must be a list.'
-        raise ValueError(msg)
-    if not isinstance(error_bounds, list):
-        msg = 'error_bounds must be a list.'
-        raise ValueError(msg)
-    if not isinstance(nsamp_posterior, int):
-        msg = 'nsamp_posterior must be an integer.'
+    for name, val, types, msg in (
+            ('n_mef', n_mef, int, 'an integer'), 
+            ('estimate_bounds', estimate_bounds, list, 'a list'), 
+            ('error_bounds', error_bounds, list, 'a list'), 
+            ('nsamp_posterior', nsamp_posterior, int, 'an integer')):
+        if not isinstance(val, types):
+            raise ValueError('{} must be {}.'.format(name, msg))
+    if fmt not in ('fits', 'hdf5'):
+        msg = "fmt must be 'fits' or 'hdf5'."
         raise ValueError(msg)
+    if save_to and not isinstance(save_to, str):
+        msg = 'save_to must be an string.'
+        raise ValueError(msg) 
+    if zipname and not isinstance(zipname, str):
+        msg = 'zipname must be an string.'
+        raise ValueError(msg) 
         
     if isinstance(mefnames, str):
-        mefnames = [str(mefnames)] * n_mef
+        mefnames = [mefnames+str(i+1) for i in range(n_mef)]
+    ext = '.fits' if fmt == 'fits' else '.h5'
+    mef_files = [str(mefname)+ext for mefname in mefnames]
+    save_files = save_to and (keep_fits or not zipname)
                 
-    if not isinstance(n_estimates, list):
-        n_estimates = [n_estimates] * n_mef
-        
-    if  isinstance(n_inj, int):
-        n_inj = [n_inj] * n_mef
+    # explicit sizes, so that each MEF gets dense arrays of known shape
+    n_estimates = _mef_sizes(n_estimates, n_mef, 'n_estimates')
+    n_inj = _mef_sizes(n_inj, n_mef, 'n_inj')
+    if len(mef_files) != n_mef:
+        msg = 'mefnames must be a string or a list of n_mef names.'
+        raise ValueError(msg)
+    
+    
+    # SFC64 is the fastest bit generator shipped with numpy
+    rng = Generator(SFC64(seed))
     
+    # draw the estimates, errors and posteriors of all MEFs/injections at 
+    # once, then slice them into per-MEF (n_inj, n_estimates[, nsamp]) views
+    sizes = [n_inj[i]*n_estimates[i] for i in range(n_mef)]
+    offsets = np.cumsum([0]+sizes)
+    # (single precision is enough for mock data, and is what is saved)
+    all_est = rng.random(size=offsets[-1], dtype=np.float32)
+    all_est *= estimate_bounds[1]-estimate_bounds[0]
+    all_est += estimate_bounds[0]
+    all_err = rng.random(size=offsets[-1], dtype=np.float32)
+    all_err *= error_bounds[1]-error_bounds[0]
+    all_err += error_bounds[0]
+    # posteriors: N(estimate, error)
+    all_post = np.empty((offsets[-1], nsamp_posterior), dtype=np.float32)
+    rng.standard_normal(dtype=np.float32, out=all_post)
+    all_post *= all_err[:, None]
+    all_post += all_est[:, None]
     
-    d_list=[]
+    d_list = []
     for i in range(n_mef):
-        list_est, list_err, list_post = [], [], []
-        for inj in range(n_inj[i]):
-            #print(i, inj, n_estimates[i])
-            estimate = np.random.uniform(low=estimate_bounds[0], 
-                                         high=estimate_bounds[1], 
-                                         size=n_estimates[i])
-            error    = np.random.uniform(low=error_bounds[0], 
-                                         high=error_bounds[1], 
-                                         size=n_estimates[i])
-            post_list=[]
-            for j in range(n_estimates[i]):
-                post = np.random.normal(loc=estimate[j], scale=error[j], 
-                                        size=nsamp_posterior)
-                post_list.append(post)
-            list_est.append(estimate)
-            list_err.append(error)
-            list_post.append(np.array(post_list))
-            
-        d = (np.array(list_est), np.array(list_err), np.array(list_post))
-        d_list.append(d)
-        
-        if save_to:
-            if not isinstance(save_to, str):
-                msg = 'save_to must be an string.'
-                raise ValueError(msg) 
-            #fitsname= str(save_to)+str(mefname)+str(i+1)+'.fits'
-            fitsname= str(save_to)+str(mefnames[i])
-            vip.fits.write_fits(fitsfilename=fitsname, array=d, verbose=False)
-        
-    if zipname:
-        if not isinstance(zipname, str):
-            msg = 'zipname must be an string.'
-            raise ValueError(msg) 
-        if not save_to:
-            msg = 'For generating a ZIP file, the save_to parameter must be used as path.'
-            raise ValueError(msg) 
+        shape = (n_inj[i], n_estimates[i])
+        mef_est = all_est[offsets[i]:offsets[i+1]].reshape(shape)
+        mef_err = all_err[offsets[i]:offsets[i+1]].reshape(shape)
+        mef_post = all_post[offsets[i]:offsets[i+1]].reshape(
+                                                shape+(nsamp_posterior,))
+        d_list.append((mef_est, mef_err, mef_post))
+    
+    if save_files or zipname:
+        with contextlib.ExitStack() as stack:
+            if zipname:
+                # written through a 1 MB buffer
+                fh = stack.enter_context(open(zipname, 'wb', 
+                                              buffering=1<<20))
+                zf = stack.enter_context(zipfile.ZipFile(fh, 'w', 
+                                         compression=compression, 
+                                         allowZip64=True))
             
-        f = zipfile.ZipFile(str(zipname), 'w')
-        for i in range(n_mef): 
-            fitsname= str(save_to)+str(mefnames[i])+'.fits'
-            #fitsname= str(save_to)+str(mefname)+str(i+1)
-            f.write(fitsname)
-            os.remove(fitsname) 
+            if fmt == 'fits' and not save_files:
+                # ZIP only: FITS streamed straight into the ZIP entries
+                for mef_file, d in zip(mef_files, d_list):
+                    with zf.open(mef_file, 'w', force_zip64=True) as entry:
+                        _mef_hdulist(d).writeto(entry, output_verify='ignore', 
+                                                checksum=False)
+            else:
+                # MEFs serialized (and saved) concurrently, zipped in order; 
+                # at most n_workers serialized MEFs are in flight at a time
+                paths = [save_to+mef_file if save_files else None 
+                         for mef_file in mef_files]
+                n_workers = max(1, min(n_mef, os.cpu_count() or 1))
+                ex = stack.enter_context(ThreadPoolExecutor(n_workers))
+                pending = deque()
+                for i in range(n_mef+n_workers):
+                    if i < n_mef:
+                        pending.append(ex.submit(_save_mef, d_list[i], 
+                                                 paths[i], fmt=fmt))
+                    if i >= n_workers:
+                        buf = pending.popleft().result()
+                        if zipname:
+                            zf.writestr(mef_files[i-n_workers], 
+                                        buf.getbuffer())
             
     return d_list
 
 
 
 def read_submission(zipfilename, fitsfilenames=None, read_estimates=True, 
-                    read_errors=True, read_posteriors=False, verbose=False):
+                    read_errors=True, read_posteriors=False, dtype=np.float32, 
+                    verbose=False):
     '''
     Function to read the ZIP file submitted by a participant of the data challenge.
     
-    The ZIP file is extracted in a temporal folder that it is then removed.
+    The MEF files are read directly from the ZIP file, without extracting them 
+    to disk. Files with a '.h5' or '.hdf5' extension are read as HDF5 files 
+    (see create_mefs), which requires h5py. Members larger than 64 MB are 
+    spooled to a temporary file placed in the folder given by the 
+    EIDC_LOCALBUFF environment variable, or by default in the system 
+    temporary folder.
     
     Parameters
     ----------
@@ -145,7 +216,11 @@ def read_submission(zipfilename, fitsfilenames=None, read_estimates=True,
         Name of the ZIP file.
     ·  fitsfilenames: list 
         (optional).List of files to search for inside the ZIP file. If None, 
-        all files in the ZIP are extracted.
+        all MEF files (.fits, .h5 or .hdf5) in the ZIP are read, skipping 
+        hidden files (e.g. the '__MACOSX/._*' entries added by macOS).
+    ·  dtype: numpy dtype
+        (optional) Data type of the returned arrays. By default, single 
+        precision (float32), the precision of the MEF files.
     ·  verbose: boolean
         (optional) Show additional information.
         
@@ -158,20 +233,13 @@ def read_submission(zipfilename, fitsfilenames=None, read_estimates=True,
         the third the posteriors.
     '''
         
-    if isinstance(zipfilename, str):
-        file = zipfile.ZipFile(zipfilename)
-    else:
+    if not isinstance(zipfilename, str):
         msg = 'zipfilename must be an string.'
         raise ValueError(msg)
         
-    tempfolder = ctime()    
-    os.mkdir(str(tempfolder))
-    
     if fitsfilenames is not None:
         if isinstance(fitsfilenames, list):
             if all(isinstance(item, str) for item in fitsfilenames):
-                for i in fitsfilenames: 
-                    file.extract(i, str(tempfolder))
                 names = fitsfilenames
             else:
                 msg = 'each item in fitsfilenames must be an string.'
@@ -180,25 +248,31 @@ def read_submission(zipfilename, fitsfilenames=None, read_estimates=True,
             msg = 'fitsfilenames must be a list or a None.'
             raise ValueError(msg) 
     else:
-        file.extractall(str(tempfolder))
-        names = file.namelist()
+        # only stream the MEF files
+        with zipfile.ZipFile(zipfilename) as file:
+            names = [zi.filename for zi in file.infolist() 
+                     if zi.filename.lower().endswith(_MEF_EXTENSIONS) and 
+                     not os.path.basename(zi.filename).startswith('.')]
+
+    # read the MEF files concurrently (I/O-bound)
+    read_hdus = (read_estimates, read_errors, read_posteriors)
+    localbuff = os.environ.get('EIDC_LOCALBUFF')
+    with ThreadPoolExecutor(max_workers=max(1, min(16, len(names)))) as ex:
+        mef_list = list(ex.map(lambda mef: _read_mef(zipfilename, mef, 
+                                                     read_hdus, dtype, 
+                                                     localbuff), 
+                               names))
 
     est, errors, post = [], [], []
-    for mef in names:
+    for mef, (estimates, uncertanties, posteriors) in zip(names, mef_list):
         if verbose: 
             print('File '+str(mef)+':')
-        mef_ = mef.removesuffix('.fits')
         if read_estimates:
-            estimates    = np.array(vip.fits.open_fits(fitsfilename=str(tempfolder)+'/'+str(mef_), n=0, verbose=verbose))
             est.append(estimates)
         if read_errors:
-            uncertanties = np.array(vip.fits.open_fits(fitsfilename=str(tempfolder)+'/'+str(mef_), n=1, verbose=verbose))
             errors.append(uncertanties)
         if read_posteriors:
-            posteriors   = np.array(vip.fits.open_fits(fitsfilename=str(tempfolder)+'/'+str(mef_), n=2, verbose=verbose))
             post.append(posteriors)
-    file.close()
-    shutil.rmtree(str(tempfolder))
     
     # returns
     if read_estimates:
@@ -284,7 +358,9 @@ def eval_astro(array_user_astro, array_gt_astro):
     Parameters
     ----------
     ·  array_user_astro: numpy array
-       Array with all astrometry estimates of the submission
+       Array with all astrometry estimates of the submission, i.e. one 
+       (n_injections, 2) array per cube, or a (2,) array for a cube with a 
+       single injection
     ·  array_gt_astro: numpy array
        Array with all astrometry ground truth to compare the submission
        
@@ -293,24 +369,26 @@ def eval_astro(array_user_astro, array_gt_astro):
     ·  metric_astro_user: Astrometry mean distance metric 
     '''
     
-    list_dist_astro_cubes=[] 
-    for i in range(len(array_gt_astro)): # loop on cubes
-        list_dist_astro_planets=[]
-        for j in range(len(array_gt_astro[i])): # loop on injections
-            dxy_user = array_user_astro[i][j]
-            dxy_gt   = array_gt_astro[i][j]
-
-            if np.allclose(dxy_user, -1*np.ones_like(dxy_gt)):
-                dxy_user = np.zeros_like(dxy_gt)
+    # all injections of all cubes at once: (n_injections, 2) arrays (a single
+    # injection may be stored as a 1D (2,) array)
+    _check_cubes(array_gt_astro, array_user_astro)
+    array_gt_astro = [np.atleast_2d(cube) for cube in array_gt_astro]
+    array_user_astro = [np.atleast_2d(cube) for cube in array_user_astro]
+    if any(cube.ndim != 2 or cube.shape[-1] != 2 for cube in array_gt_astro):
+        msg = "Astrometry arrays must have a (n_injections, 2) shape."
+        raise TypeError(msg)
+    n_inj = [len(cube) for cube in array_gt_astro]
+    dxy_gt   = np.concatenate(array_gt_astro)
+    dxy_user = np.concatenate(array_user_astro)
 
-            dist_xy = distance_L2(dxy_gt, dxy_user)
+    # injections flagged with -1 (not retrieved) are set to zero
+    not_found = np.all(np.isclose(dxy_user, -1), axis=-1)
+    dxy_user[not_found] = 0
 
-            list_dist_astro_planets.append(dist_xy)
+    dist_xy = distance_L2(dxy_gt, dxy_user, axis=-1)
 
-        dist_astro_cube = np.mean(list_dist_astro_planets)   
-        list_dist_astro_cubes.append(dist_astro_cube)
-
-    metric_astro_user = np.mean(list_dist_astro_cubes)
+    dist_astro_cubes = _group_mean(dist_xy, n_inj)
+    metric_astro_user = np.mean(dist_astro_cubes)
     
     return metric_astro_user
 
@@ -328,7 +406,8 @@ def eval_photo(array_user_photo, array_gt_photo):
     Parameters
     ----------
     ·  array_user_photo: numpy array
-       Array with all astrometry estimates of the submission
+       Array with all astrometry estimates of the submission, i.e. one 
+       (n_injections, n_channels) array per cube
     ·  array_gt_photo: numpy array
        Array with all astrometry ground truth to compare the submission
        
@@ -337,25 +416,139 @@ def eval_photo(array_user_photo, array_gt_photo):
     ·  metric_photo_user: Spectrophotometry mean distance metric 
     '''
     
-    list_dcontrast_cube=[]
-    for i in range(len(array_gt_photo)): # cube
-        list_dcontrast_planets=[]
-        for j in range(len(array_gt_photo[i])): # injection
-            # curve_user = array_user_photo[i][j]
-            # curve_gt   = array_gt_photo[i][j]                
-            # for k in range(len(curve_gt)): # wavelength
-            #     if curve_gt[k].ndim==1:
-            #         gt = curve_gt[k]
-            #     if curve_gt[k].ndim==2:
-            #         gt = np.array([item for sublist in curve_gt[k] for item in sublist]) 
-            #     if curve_user[k] == -1:
-            #         curve_user[k] = 0
-                    
-            dist_contrast = distance_L1(array_gt_photo[i][j], 
-                                        array_user_photo[i][j])
-
-            list_dcontrast_planets.append(np.mean(dist_contrast))
-        list_dcontrast_cube.append(np.mean(list_dcontrast_planets))
-    metric_photo_user = np.mean(list_dcontrast_cube)
+    # all injections of all cubes at once, flattened (whatever the dimension 
+    # of the contrasts of each injection) since the number of channels may 
+    # differ between cubes
+    _check_cubes(array_gt_photo, array_user_photo)
+    n_inj = [len(cube) for cube in array_gt_photo]
+    n_val = np.repeat([np.size(cube)//max(len(cube), 1) 
+                       for cube in array_gt_photo], n_inj)
+    curves_gt   = np.concatenate([np.ravel(cube) for cube in array_gt_photo])
+    curves_user = np.concatenate([np.ravel(cube) for cube in array_user_photo])
+            
+    dist_contrast = distance_L1(curves_gt, curves_user)
+
+    # mean per injection, then per cube
+    dist_planets = _group_mean(dist_contrast, n_val)
+    dist_contrast_cubes = _group_mean(dist_planets, n_inj)
+    metric_photo_user = np.mean(dist_contrast_cubes)
+    
+    return metric_photo_user
+
+
+
+def _mef_sizes(val, n_mef, name):
+    '''
+    Function that converts an integer, common to all MEF files, or a sequence 
+    of n_mef integers (e.g. a list of numpy integers, or an array) into a list 
+    of n_mef Python integers.
+    '''
+    msg = '{} must be an integer or a list of n_mef integers.'.format(name)
+    if isinstance(val, numbers.Integral):
+        val = [val] * n_mef
+    try:
+        sizes = [operator.index(item) for item in val]
+    except TypeError:
+        raise ValueError(msg)
+    if len(sizes) != n_mef:
+        raise ValueError(msg)
+        
+    return sizes
+
+
+
+def _mef_hdulist(d):
+    '''
+    Function that builds the HDUList of a MEF file from a tuple of arrays 
+    (estimates, uncertanties, posteriors). Like vip.fits.write_fits, the data 
+    are stored in single precision.
+    '''
+    hdul = fits.HDUList([fits.PrimaryHDU(d[0].astype(np.float32, 
+                                                      copy=False))])
+    for array in d[1:]:
+        hdul.append(fits.ImageHDU(array.astype(np.float32, copy=False)))
+        
+    return hdul
+
+
+
+def _save_mef(d, path=None, fmt='fits'):
+    '''
+    Function that serializes a tuple of arrays (estimates, uncertanties, 
+    posteriors) as a MEF file in memory, and optionally writes it to path in a 
+    single call. It returns the in-memory buffer.
+    '''
+    buf = io.BytesIO()
+    if fmt == 'fits':
+        # freshly built HDUs: no need for verification or checksums
+        _mef_hdulist(d).writeto(buf, output_verify='ignore', checksum=False)
+    else:
+        _write_hdf5(buf, d)
+    if path:
+        with open(path, 'wb') as f:
+            f.write(buf.getbuffer())
+    
+    return buf
+
+
+
+def _write_hdf5(buf, d):
+    '''
+    Function that writes a tuple of arrays (estimates, uncertanties, 
+    posteriors) as the three datasets of an HDF5 file (requires h5py).
+    '''
+    import h5py
+    with h5py.File(buf, 'w') as f:
+        for key, array in zip(_HDF5_KEYS, d):
+            f.create_dataset(key, data=array, chunks=True)
+
+
+
+def _read_mef(zipfilename, mef, read_hdus, dtype=np.float32, localbuff=None):
+    '''
+    Function that streams a MEF file out of a ZIP file and reads its HDUs. The 
+    ZIP file is opened with its own handle, so that several MEF files can be 
+    read in concurrent threads. The whole member is read, whatever the HDUs 
+    requested, and spooled to a temporary file in the localbuff folder (by 
+    default, the system temporary folder) if larger than 64 MB. It returns a 
+    list with the data of the three HDUs, where those not flagged in read_hdus 
+    are None.
+    '''
+    with zipfile.ZipFile(zipfilename) as zf, \
+         tempfile.SpooledTemporaryFile(max_size=1<<26, dir=localbuff) as buf:
+        with zf.open(mef) as member:
+            shutil.copyfileobj(member, buf, length=1<<20)
+        buf.seek(0)
+        if mef.lower().endswith(('.h5', '.hdf5')):
+            import h5py
+            with h5py.File(buf, 'r') as f:
+                return [np.array(f[key], dtype=dtype) if read else None 
+                        for key, read in zip(_HDF5_KEYS, read_hdus)]
+        # the whole member (posteriors included) has been spooled: lazy 
+        # loading only skips parsing the HDUs that are not requested. Their 
+        # data are copied out so that the buffer can be closed
+        with fits.open(buf, memmap=True, lazy_load_hdus=True) as hdul:
+            return [np.array(hdul[n].data, dtype=dtype, copy=True) 
+                    if read else None for n, read in enumerate(read_hdus)]
+
+
+
+def _check_cubes(array_gt, array_user):
+    '''
+    Function that checks that the ground truth and the submission have the 
+    same number of cubes, and arrays of the same shape for each cube.
+    '''
+    if [np.shape(cube) for cube in array_gt] != \
+       [np.shape(cube) for cube in array_user]:
+        raise TypeError("Provide identical format for submission and gt.")
+
+
+
+def _group_mean(values, sizes):
+    '''
+    Function that computes the mean of consecutive groups of elements of a 1D 
+    array (e.g. the injections of each cube), given the size of each group.
+    '''
+    groups = np.repeat(np.arange(len(sizes)), sizes)
     
-    return metric_photo_user
\ No newline at end of file
+    return np.bincount(groups, weights=values, minlength=len(sizes))/sizes
\ No newline at end of file
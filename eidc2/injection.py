@@ -6,17 +6,17 @@ of the Exoplanet Imaging Data Challenge
 """
 
 __author__ = 'Valentin Christiaens'
-__all__ = ['inject_fcp_ifs']
+__all__ = ['inject_fcp_ifs',
+           'resample_star_model']
 
 import numpy as np
-from special.model_resampling import resample_model
-from vip_hci.fm import cube_inject_companions
 
 
 def inject_fcp_ifs(cube, derot_angles, psf, rtheta_planet, planet_spec, 
                    star_obs_spec, star_mod_spec, mean_contrast, spec_res=None, 
                    transmission=None, norm_fac=None, plsc=None, imlib='vip-fft', 
-                   interpolation=None, verbose=False, full_output=False):
+                   interpolation=None, verbose=False, full_output=False, 
+                   star_flux_sum=None):
     """ Function to inject a fake companion with a given input spectrum into an 
     IFS data cube.
 
@@ -49,6 +49,9 @@ def inject_fcp_ifs(cube, derot_angles, psf, rtheta_planet, planet_spec,
         Model (or calibrated) spectrum of the star. Dimensions should be 
         (2 x n_channels), where the first dimension should provide the 
         wavelengths in microns, and the second the fluxes (arbitrary units).
+        It is resampled at the wavelengths of star_obs_spec, unless already 
+        sampled at these wavelengths - e.g. with ``resample_star_model``, 
+        to resample it only once when injecting many fake companions.
     mean_contrast: float
         Requested mean contrast (over all channels) between the fake companion 
         and the star, used to scale the fluxes of the companion spectrum before
@@ -79,6 +82,11 @@ def inject_fcp_ifs(cube, derot_angles, psf, rtheta_planet, planet_spec,
         Whether to print more information during processing.
     full_output: bool, optional
         Whether to also return the fluxes of the injected planet.
+    star_flux_sum: float, optional
+        Sum of the fluxes of star_obs_spec, used to scale the companion 
+        spectrum to mean_contrast. If not provided, it is computed from 
+        star_obs_spec. Providing it avoids recomputing it when injecting many 
+        fake companions with the same star spectrum.
     
     Returns
     -------
@@ -89,6 +97,10 @@ def inject_fcp_ifs(cube, derot_angles, psf, rtheta_planet, planet_spec,
         Fluxes used for the injected planet
     """
 
+    # heavy dependencies, only imported when used
+    from special.model_resampling import resample_model
+    from vip_hci.fm import cube_inject_companions
+
     r, theta = rtheta_planet
 
     # convolve + resample the fcp model spectrum, if needed
@@ -97,16 +109,17 @@ def inject_fcp_ifs(cube, derot_angles, psf, rtheta_planet, planet_spec,
                                      planet_spec[1], instru_res=spec_res)
     
     # convolve + resample the star model spectrum, if needed
-    if not np.array_equal(star_obs_spec[0], star_mod_spec[0]):
-        star_mod_spec = resample_model(star_obs_spec[0], star_mod_spec[0], 
-                                       star_mod_spec[1], instru_res=spec_res)
+    star_mod_spec = resample_star_model(star_obs_spec, star_mod_spec, 
+                                        spec_res=spec_res)
     
     # find flux scaling factor
     ## instrumental+atm effects
     planet_spec = (star_obs_spec[1]/star_mod_spec[1])*planet_spec[1]
     ## contrast
-    scal_fac = mean_contrast*np.sum(star_obs_spec[1])/np.sum(planet_spec)
-    fluxes = scal_fac*planet_spec
+    if star_flux_sum is None:
+        star_flux_sum = np.sum(star_obs_spec[1])
+    scal_fac = mean_contrast*star_flux_sum/np.sum(planet_spec)
+    fluxes = np.multiply(planet_spec, scal_fac, out=planet_spec)
     if verbose:
         msg = "Flux levels used for planet injection"
         msg+= " (before considering airmass): "
@@ -118,7 +131,8 @@ def inject_fcp_ifs(cube, derot_angles, psf, rtheta_planet, planet_spec,
             msg = "Normalization factors and derotation angles should have "
             msg += "same length."
             raise TypeError(msg)
-        flevel = np.outer(fluxes, norm_fac)
+        # (n_channels, n_frames) flux levels, as expected for 4D cubes
+        flevel = np.multiply.outer(fluxes, norm_fac)
     else:
         flevel = fluxes
     
@@ -132,4 +146,40 @@ def inject_fcp_ifs(cube, derot_angles, psf, rtheta_planet, planet_spec,
     if full_output:
         return fcp_cube, fluxes
     else:
-        return fcp_cube
\ No newline at end of file
+        return fcp_cube
+
+
+
+def resample_star_model(star_obs_spec, star_mod_spec, spec_res=None):
+    """ Function to convolve and resample the model spectrum of the star at 
+    the wavelengths of the spectrum measured by the IFU. The result can be 
+    provided as star_mod_spec to ``inject_fcp_ifs``, to avoid resampling it 
+    for each injection.
+
+    Parameters
+    ----------
+    star_obs_spec: 2D numpy array
+        Spectrum of the star, as measured by the IFU. Dimensions should be 
+        (2 x n_channels), where the first dimension should provide the 
+        wavelengths in microns, and the second the fluxes (arbitrary units).
+    star_mod_spec: 2D numpy array
+        Model (or calibrated) spectrum of the star. Dimensions should be 
+        (2 x n_wavelengths), where the first dimension should provide the 
+        wavelengths in microns, and the second the fluxes (arbitrary units).
+    spec_res: float, optional
+        Spectral resolution of the instrument. If provided, it is used to 
+        convolve the model spectrum before resampling.
+    
+    Returns
+    -------
+    star_mod_spec : 2D numpy array
+        Model spectrum of the star resampled at the wavelengths of 
+        star_obs_spec. Returned as is if already sampled at these wavelengths.
+    """
+    
+    if np.array_equal(star_obs_spec[0], star_mod_spec[0]):
+        return star_mod_spec
+    
+    from special.model_resampling import resample_model
+    return resample_model(star_obs_spec[0], star_mod_spec[0], 
+                          star_mod_spec[1], instru_res=spec_res)
\ No newline at end of file
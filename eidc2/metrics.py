@@ -23,7 +23,8 @@ def distance_L1(gts, estimates, norm=True):
     estimates : numpy array
         Array with the estimates.
     norm: bool, optional
-        Whether to scale the distance with ground truth value
+        Whether to scale the distance with ground truth value. Null ground 
+        truth values are not scaled.
         
     Returns
     -------
@@ -35,16 +36,23 @@ def distance_L1(gts, estimates, norm=True):
     if estimates.shape !=  gts.shape:
         raise TypeError("Provide identical format for estimates and gts.")
 
-    dist = np.abs(gts-estimates)
+    # single buffer for the difference, its absolute value and its scaling 
+    # (an actual array, also for 0d inputs)
+    dist = np.empty(np.shape(gts), dtype=np.result_type(gts, estimates, 1.))
+    np.subtract(gts, estimates, out=dist)
+    np.abs(dist, out=dist)
     
     if norm:
-        dist /= np.abs(gts)
-        
-    return dist
+        # null ground truths are left unscaled (no division by zero)
+        abs_gts = np.abs(gts)
+        np.divide(dist, abs_gts, out=dist, where=abs_gts != 0)
+    
+    # scalar for 0d inputs
+    return dist[()]
 
 
 
-def distance_L2(gts, estimates, norm=False):
+def distance_L2(gts, estimates, norm=False, axis=None):
     """ Function to estimate the goodness of an estimation, based on the 
     L2 norm distance between estimates and ground truths.
 
@@ -55,7 +63,11 @@ def distance_L2(gts, estimates, norm=False):
     estimates : numpy array
         Array with the estimates.
     norm: bool, optional
-        Whether to scale the distance with ground truth value
+        Whether to scale the distance with ground truth value. Null ground 
+        truth values are not scaled.
+    axis: None or int, optional
+        Axis along which the L2 norm is computed. By default, it is computed 
+        over the whole arrays.
         
     Returns
     -------
@@ -68,10 +80,22 @@ def distance_L2(gts, estimates, norm=False):
         raise TypeError("Provide identical format for estimates and gts.")
 
        
-
+    # actual array buffer (also for 0d inputs), in double precision so that 
+    # the squares are accumulated in double precision for float32 inputs
+    diff = np.empty(np.shape(gts), 
+                    dtype=np.result_type(gts, estimates, np.float64))
+    np.subtract(gts, estimates, out=diff)
     if norm:
-        dist = np.sqrt(np.sum(np.power((gts-estimates)/gts, 2))) 
+        # null ground truths are left unscaled (no division by zero)
+        np.divide(diff, gts, out=diff, where=gts != 0)
+    
+    # square and sum fused in a single pass (double-precision BLAS dot 
+    # product for the whole arrays)
+    if axis is None:
+        diff = diff.ravel()
+        dist = np.sqrt(np.dot(diff, diff))
     else:
-        dist = np.sqrt(np.sum(np.power(gts-estimates, 2)))
+        diff = np.moveaxis(diff, axis, -1)
+        dist = np.sqrt(np.einsum('...i,...i->...', diff, diff))
 
     return dist
\ No newline at end of file
@@ -72,7 +72,8 @@ setup(
               'develop': InstallDevReqs},
     packages=PACKAGES,
     install_requires=reqs,
-    extras_require={"dev": reqs_dev},
+    extras_require={"dev": reqs_dev,
+                    "hdf5": ["h5py"]},
     zip_safe=False,
     classifiers=['Intended Audience :: Science/Research',
                  'License :: OSI Approved :: MIT License',
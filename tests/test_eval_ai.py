@@ -0,0 +1,83 @@
+#! /usr/bin/env python
+
+"""
+Tests for the evaluation routines of the Exoplanet Imaging Data Challenge
+"""
+
+import numpy as np
+import pytest
+from eidc2.eval_ai import eval_astro, eval_photo
+
+
+def _ref_astro(array_user, array_gt):
+    # per-injection loop reference
+    dist_cubes = []
+    for cube_user, cube_gt in zip(array_user, array_gt):
+        dist_planets = []
+        for dxy_user, dxy_gt in zip(np.atleast_2d(cube_user), 
+                                    np.atleast_2d(cube_gt)):
+            if np.allclose(dxy_user, -1):
+                dxy_user = np.zeros_like(dxy_gt)
+            dist_planets.append(np.sqrt(np.sum((dxy_gt-dxy_user)**2)))
+        dist_cubes.append(np.mean(dist_planets))
+    return np.mean(dist_cubes)
+
+
+def _ref_photo(array_user, array_gt):
+    # per-injection loop reference
+    dist_cubes = []
+    for cube_user, cube_gt in zip(array_user, array_gt):
+        dist_planets = []
+        for curve_user, curve_gt in zip(cube_user, cube_gt):
+            scale = np.where(curve_gt != 0, np.abs(curve_gt), 1)
+            dist_planets.append(np.mean(np.abs(curve_gt-curve_user)/scale))
+        dist_cubes.append(np.mean(dist_planets))
+    return np.mean(dist_cubes)
+
+
+def test_eval_astro():
+    rng = np.random.default_rng(0)
+    # ragged cubes, including a single injection stored as a (2,) array
+    array_gt = [rng.random((n, 2))*10 for n in (1, 3, 5)]+[rng.random(2)]
+    array_user = [gt+rng.normal(size=gt.shape) for gt in array_gt]
+    # injections flagged as not retrieved
+    array_user[1][1] = -1
+    array_user[2][[0, 4]] = -1
+    ref = _ref_astro(array_user, array_gt)
+    assert np.isclose(eval_astro(array_user, array_gt), ref)
+
+
+def test_eval_astro_single_injection():
+    gt, user = np.array([1., 2.]), np.array([1.5, 2.5])
+    assert np.isclose(eval_astro([user], [gt]), np.sqrt(0.5))
+
+
+def test_eval_astro_shapes():
+    rng = np.random.default_rng(0)
+    with pytest.raises(TypeError):
+        eval_astro([rng.random((3, 2))], [rng.random((2, 2))])
+    with pytest.raises(TypeError):
+        eval_astro([rng.random((2, 2))], [rng.random((2, 2))]*2)
+    for shape in ((2, 3), (2, 2, 3), (2, 2, 2)):
+        with pytest.raises(TypeError):
+            eval_astro([rng.random(shape)], [rng.random(shape)])
+
+
+def test_eval_photo():
+    rng = np.random.default_rng(0)
+    # ragged cubes: different numbers of injections and channels
+    array_gt = [rng.random((n, n_ch)) for n, n_ch in ((1, 39), (3, 39), 
+                                                      (2, 10))]
+    array_user = [gt+rng.normal(scale=0.1, size=gt.shape) for gt in array_gt]
+    # null ground truths are not scaled
+    array_gt[1][2, :5] = 0
+    ref = _ref_photo(array_user, array_gt)
+    assert np.isclose(eval_photo(array_user, array_gt), ref)
+
+
+def test_eval_photo_shapes():
+    rng = np.random.default_rng(0)
+    with pytest.raises(TypeError):
+        eval_photo([rng.random((2, 39))], [rng.random((2, 10))])
+    with pytest.raises(TypeError):
+        eval_photo([rng.random((2, 39))], [rng.random((2, 39))]*2)
@@ -0,0 +1,42 @@
+#! /usr/bin/env python
+
+"""
+Tests for the distance metrics of the Exoplanet Imaging Data Challenge
+"""
+
+import numpy as np
+from eidc2.metrics import distance_L1, distance_L2
+
+
+def test_distance_L1_0d():
+    gt, estimate = np.array(2.), np.array(1.)
+    assert distance_L1(gt, estimate, norm=False) == 1.
+
+
+def test_distance_L1_norm_0d():
+    gt, estimate = np.array(2.), np.array(1.)
+    assert distance_L1(gt, estimate, norm=True) == 0.5
+    assert distance_L1(np.array(0.), estimate, norm=True) == 1.
+
+
+
+def test_distance_L2_0d():
+    gt, estimate = np.array(2.), np.array(1.)
+    assert distance_L2(gt, estimate, norm=False) == 1.
+    assert distance_L2(gt, estimate, norm=True) == 0.5
+
+
+def test_distance_L2_float32_axis():
+    rng = np.random.default_rng(0)
+    gts = (100+rng.random((4, 10**6))).astype(np.float32)
+    estimates = np.zeros_like(gts)
+    ref = np.sqrt(np.sum(np.square(gts.astype(np.float64)), axis=-1))
+    assert np.allclose(distance_L2(gts, estimates, axis=-1), ref, rtol=1e-9)
+
+
+def test_distance_L2_float32():
+    rng = np.random.default_rng(0)
+    gts = (100+rng.random(10**7)).astype(np.float32)
+    estimates = np.zeros_like(gts)
+    ref = np.sqrt(np.sum(np.square(gts.astype(np.float64))))
+    assert np.isclose(distance_L2(gts, estimates), ref, rtol=1e-9)